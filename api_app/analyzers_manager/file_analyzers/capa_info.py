@@ -6,9 +6,14 @@ import logging
 import os
 import shutil
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shlex import quote
 
+import orjson
 import requests
 from django.conf import settings
 
@@ -24,7 +29,81 @@ RULES_LOCATION = f"{BASE_LOCATION}/capa-rules"
 SIGNATURE_LOCATION = f"{BASE_LOCATION}/sigs"
 RULES_FILE = f"{RULES_LOCATION}/capa_rules.zip"
 RULES_URL = "https://github.com/mandiant/capa-rules/archive/refs/tags/"
+LATEST_RELEASE_URL = "https://api.github.com/repos/mandiant/capa-rules/releases/latest"
+LATEST_RELEASE_CACHE_TTL = 60 * 10
+VERSION_STAMP_FILE = f"{BASE_LOCATION}/capa_rules.version"
+VERSION_STAMP_TTL = 60 * 60 * 6
+SIGNATURES_URL = "https://api.github.com/repos/mandiant/capa/contents/sigs"
 CACHE_LOCATION = os.environ.get("XDG_CACHE_HOME", f"{settings.MEDIA_ROOT}/.cache")
+# computed once: capa only needs its cache pointed to CACHE_LOCATION
+CAPA_ENV = {**os.environ, "XDG_CACHE_HOME": CACHE_LOCATION}
+# bounded to stay well below GitHub rate limits
+SIGNATURE_DOWNLOAD_WORKERS = 8
+SIGNATURE_CHUNK_SIZE = 1024 * 1024
+
+# shared across analyses to reuse connections to GitHub
+_SESSION = requests.Session()
+
+# url -> (value, expires_at)
+_LATEST_VERSION_CACHE: dict[str, tuple[str, float]] = {}
+_LATEST_VERSION_CACHE_LOCK = threading.Lock()
+
+
+def _read_version_stamp() -> dict | None:
+    try:
+        with open(VERSION_STAMP_FILE) as f:
+            stamp = json.load(f)
+        return stamp if {"tag", "checked_at"} <= stamp.keys() else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_version_stamp(tag: str, etag: str | None = None) -> None:
+    if etag is None:
+        # keep the validator of the previous lookup if it still describes the same tag
+        previous = _read_version_stamp()
+        if previous and previous["tag"] == tag:
+            etag = previous.get("etag")
+    try:
+        with open(VERSION_STAMP_FILE, "w") as f:
+            json.dump({"tag": tag, "etag": etag, "checked_at": time.time()}, f)
+    except OSError as e:
+        logger.warning(f"Failed to write capa rules version stamp at {VERSION_STAMP_FILE}: {e}")
+
+
+def _get_latest_capa_version() -> str:
+    """
+    Retrieve the latest capa-rules release tag,
+    caching it for LATEST_RELEASE_CACHE_TTL seconds in memory and
+    for VERSION_STAMP_TTL seconds on disk to avoid
+    hitting the GitHub API on every analysis.
+    Expired entries are revalidated with a conditional request.
+    """
+    with _LATEST_VERSION_CACHE_LOCK:
+        cached = _LATEST_VERSION_CACHE.get(LATEST_RELEASE_URL)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        stamp = _read_version_stamp()
+        if stamp and time.time() - stamp["checked_at"] < VERSION_STAMP_TTL:
+            latest_version = stamp["tag"]
+        else:
+            etag = stamp.get("etag") if stamp else None
+            response = _SESSION.get(
+                LATEST_RELEASE_URL,
+                headers={"If-None-Match": etag} if etag else {},
+                timeout=30,
+            )
+            if response.status_code == 304:
+                latest_version = stamp["tag"]
+            else:
+                latest_version = response.json()["tag_name"]
+                etag = response.headers.get("ETag")
+            _write_version_stamp(latest_version, etag)
+        _LATEST_VERSION_CACHE[LATEST_RELEASE_URL] = (
+            latest_version,
+            time.monotonic() + LATEST_RELEASE_CACHE_TTL,
+        )
+        return latest_version
 
 
 class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
@@ -33,6 +112,9 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
     timeout: float = 15
     force_pull_signatures: bool = False
 
+    # CACHE_LOCATION never changes within a process: verify it only once
+    _cache_directory_ready: bool = False
+
     @classmethod
     def _ensure_cache_directory(cls) -> None:
         """
@@ -40,6 +122,8 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
         This handles incremental updates where the Dockerfile layer
         may not have created the directory.
         """
+        if cls._cache_directory_ready:
+            return
         if not os.path.isdir(CACHE_LOCATION):
             logger.info(f"Creating cache directory at {CACHE_LOCATION}")
             try:
@@ -47,11 +131,35 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
                 logger.info(f"Successfully created cache directory at {CACHE_LOCATION}")
             except OSError as e:
                 logger.warning(f"Failed to create cache directory at {CACHE_LOCATION}: {e}")
+                return
+        cls._cache_directory_ready = True
+
+    @staticmethod
+    def _download_signature(signature: dict) -> None:
+        filename = signature["name"]
+        download_url = signature["download_url"]
+
+        signature_file_path = os.path.join(SIGNATURE_LOCATION, filename)
+
+        sig_content = _SESSION.get(download_url, stream=True, timeout=30)
+        sig_content.raise_for_status()
+        # let the raw stream handle any content-encoding and copy it in large blocks
+        sig_content.raw.decode_content = True
+        with open(signature_file_path, mode="wb") as file:
+            shutil.copyfileobj(sig_content.raw, file, length=SIGNATURE_CHUNK_SIZE)
 
     @classmethod
     def _download_signatures(cls) -> None:
         logger.info(f"Downloading signatures at {SIGNATURE_LOCATION} now")
 
+        try:
+            response = _SESSION.get(SIGNATURES_URL, timeout=30)
+            response.raise_for_status()
+            signatures_list = response.json()
+        except Exception as e:
+            logger.error(f"Failed to retrieve signatures list: {e}")
+            raise AnalyzerRunException("Failed to update signatures")
+
         if os.path.exists(SIGNATURE_LOCATION):
             logger.info(f"Removing existing signatures at {SIGNATURE_LOCATION}")
             shutil.rmtree(SIGNATURE_LOCATION)
@@ -59,33 +167,30 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
         os.makedirs(SIGNATURE_LOCATION)
         logger.info(f"Created fresh signatures directory at {SIGNATURE_LOCATION}")
 
-        signatures_url = "https://api.github.com/repos/mandiant/capa/contents/sigs"
-        try:
-            response = requests.get(signatures_url)
-            signatures_list = response.json()
-
-            for signature in signatures_list:
-                filename = signature["name"]
-                download_url = signature["download_url"]
-
-                signature_file_path = os.path.join(SIGNATURE_LOCATION, filename)
-
-                sig_content = requests.get(download_url, stream=True)
-                with open(signature_file_path, mode="wb") as file:
-                    for chunk in sig_content.iter_content(chunk_size=10 * 1024):
-                        file.write(chunk)
-
-        except Exception as e:
-            logger.error(f"Failed to download signature: {e}")
-            raise AnalyzerRunException("Failed to update signatures")
+        failed_signatures = []
+        # signatures are independent downloads: fetch them concurrently,
+        # without letting a single failure stop the others
+        with ThreadPoolExecutor(max_workers=SIGNATURE_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                signature.get("name"): executor.submit(cls._download_signature, signature)
+                for signature in signatures_list
+            }
+            for filename, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Failed to download signature {filename}: {e}")
+                    failed_signatures.append(filename)
+
+        if failed_signatures:
+            raise AnalyzerRunException(f"Failed to update signatures: {failed_signatures}")
         logger.info("Successfully updated signatures")
 
     @classmethod
     def update(cls, anayzer_module: PythonModule) -> bool:
         try:
             logger.info("Updating capa rules")
-            response = requests.get("https://api.github.com/repos/mandiant/capa-rules/releases/latest")
-            latest_version = response.json()["tag_name"]
+            latest_version = _get_latest_capa_version()
             capa_rules_download_url = RULES_URL + latest_version + ".zip"
 
             cls._download_rules(
@@ -97,6 +202,7 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
             )
 
             cls._unzip(Path(RULES_FILE))
+            _write_version_stamp(latest_version)
 
             logger.info("Successfully updated capa rules")
 
@@ -107,11 +213,46 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
 
         return False
 
+    def _run_capa(self, command: list[str]) -> dict:
+        """
+        Run capa and parse its JSON report directly from the raw stdout bytes,
+        without decoding the whole output into an intermediate string.
+        """
+        with (
+            tempfile.TemporaryFile() as stderr,
+            subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, env=CAPA_ENV) as process,
+        ):
+            # parsing blocks until capa closes stdout: enforce the timeout by killing it
+            watchdog = threading.Timer(self.timeout, process.kill)
+            watchdog.start()
+            try:
+                try:
+                    result = orjson.loads(process.stdout.read())
+                    decode_error = None
+                except orjson.JSONDecodeError as e:
+                    result, decode_error = None, e
+                returncode = process.wait()
+                timed_out = not watchdog.is_alive()
+            finally:
+                watchdog.cancel()
+
+            if timed_out:
+                raise subprocess.TimeoutExpired(command, self.timeout)
+            if returncode:
+                stderr.seek(0)
+                raise subprocess.CalledProcessError(
+                    returncode,
+                    command,
+                    stderr=stderr.read().decode("utf-8", errors="ignore"),
+                )
+        if decode_error:
+            raise decode_error
+        return result
+
     def run(self):
         try:
             self._ensure_cache_directory()
-            response = requests.get("https://api.github.com/repos/mandiant/capa-rules/releases/latest")
-            latest_version = response.json()["tag_name"]
+            latest_version = _get_latest_capa_version()
 
             capa_analyzer_module = self.python_module
 
@@ -147,15 +288,7 @@ class CapaInfo(FileAnalyzer, RulesUtiliyMixin):
                 f"Starting CAPA analysis for {self.filename} with hash: {self.md5} and command: {command}"
             )
 
-            process: subprocess.CompletedProcess = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                check=True,
-            )
-
-            result = json.loads(process.stdout)
+            result = self._run_capa(command)
             result["command_executed"] = command
             result["rules_version"] = latest_version
 
@@ -0,0 +1,58 @@
+# This file is a part of IntelOwl https://github.com/intelowlproject/IntelOwl
+# See the file 'LICENSE' for copying permission.
+
+from django.db import migrations
+
+PARAMETER_NAME = "response_cache_timeout"
+PYTHON_MODULES = ["inquest.InQuest", "yeti.YETI"]
+BASE_PATH = "api_app.analyzers_manager.observable_analyzers"
+
+
+def migrate(apps, schema_editor):
+    PythonModule = apps.get_model("api_app", "PythonModule")
+    Parameter = apps.get_model("api_app", "Parameter")
+    PluginConfig = apps.get_model("api_app", "PluginConfig")
+    AnalyzerConfig = apps.get_model("analyzers_manager", "AnalyzerConfig")
+
+    for module in PYTHON_MODULES:
+        try:
+            pm = PythonModule.objects.get(module=module, base_path=BASE_PATH)
+        except PythonModule.DoesNotExist:
+            continue
+
+        parameter = Parameter(
+            name=PARAMETER_NAME,
+            type="int",
+            description="Seconds for which responses are cached and reused by following analyses. "
+            "Default is 0: caching is disabled.",
+            is_secret=False,
+            required=False,
+            python_module=pm,
+        )
+        parameter.full_clean()
+        parameter.save()
+
+        PluginConfig.objects.bulk_create(
+            [
+                PluginConfig(analyzer_config=config, parameter=parameter, value=0)
+                for config in AnalyzerConfig.objects.filter(python_module=pm)
+            ]
+        )
+
+
+def reverse_migrate(apps, schema_editor):
+    Parameter = apps.get_model("api_app", "Parameter")
+    Parameter.objects.filter(
+        name=PARAMETER_NAME,
+        python_module__module__in=PYTHON_MODULES,
+        python_module__base_path=BASE_PATH,
+    ).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api_app", "0071_delete_last_elastic_report"),
+        ("analyzers_manager", "0175_analyzer_config_cleanbrowsing_malicious_detector"),
+    ]
+
+    operations = [migrations.RunPython(migrate, reverse_migrate)]
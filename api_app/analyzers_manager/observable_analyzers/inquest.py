@@ -6,6 +6,7 @@ import re
 from typing import Dict
 
 import requests
+from django.utils.functional import cached_property
 
 from api_app.analyzers_manager.classes import ObservableAnalyzer
 from api_app.analyzers_manager.exceptions import (
@@ -13,15 +14,26 @@ from api_app.analyzers_manager.exceptions import (
     AnalyzerRunException,
 )
 from api_app.choices import Classification
+from api_app.helpers import cached_http_request
 
 logger = logging.getLogger(__name__)
 
+# shared across analyses to reuse connections to labs.inquest.net
+_SESSION = requests.Session()
+
+HASH_LENGTHS = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+
+# generic observables matching this are emails, anything else is a filename
+EMAIL_PATTERN = re.compile(r"[\w\.\+\-]+\@[\w]+\.[a-z]{2,3}")
+
 
 class InQuest(ObservableAnalyzer):
     url: str = "https://labs.inquest.net"
 
     _api_key_name: str
     inquest_analysis: str
+    # seconds InQuest responses are cached for: opt-in, 0 disables the cache
+    response_cache_timeout: int = 0
 
     @classmethod
     def update(cls) -> bool:
@@ -31,10 +43,9 @@ class InQuest(ObservableAnalyzer):
         super().config(runtime_configuration)
         self.generic_identifier_mode = "user-defined"  # Or auto
 
-    @property
+    @cached_property
     def hash_type(self):
-        hash_lengths = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
-        hash_type = hash_lengths.get(len(self.observable_name))
+        hash_type = HASH_LENGTHS.get(len(self.observable_name))
         if not hash_type:
             raise AnalyzerRunException(
                 f"Given Hash: '{self.observable_name}' is not supported. "
@@ -43,15 +54,14 @@ class InQuest(ObservableAnalyzer):
         return hash_type
 
     def type_of_generic(self):
-        if re.match(r"^[\w\.\+\-]+\@[\w]+\.[a-z]{2,3}$", self.observable_name):
-            type_ = "email"
-        else:
-            # TODO: This should be validated more thoroughly
-            type_ = "filename"
-        return type_
+        if EMAIL_PATTERN.fullmatch(self.observable_name):
+            return "email"
+        # TODO: This should be validated more thoroughly
+        return "filename"
 
     def run(self):
         headers = {"Content-Type": "application/json"}
+        inferred_type = None
         # optional API key
         if hasattr(self, "_api_key_name"):
             headers["Authorization"] = self._api_key_name
@@ -77,7 +87,7 @@ class InQuest(ObservableAnalyzer):
                     type_, value = self.observable_name.split(":")
                 except ValueError:
                     self.generic_identifier_mode = "auto"
-                    type_ = self.type_of_generic()
+                    type_ = inferred_type = self.type_of_generic()
                     value = self.observable_name
 
                 if type_ not in ["email", "filename", "registry", "xmpid"]:
@@ -101,14 +111,19 @@ class InQuest(ObservableAnalyzer):
                 "Supported are: 'dfi_search', 'iocdb_search', 'repdb_search'."
             )
 
-        response = requests.get(self.url + uri, headers=headers, timeout=30)
-        response.raise_for_status()
-        result = response.json()
+        result = cached_http_request(
+            _SESSION,
+            "GET",
+            self.url + uri,
+            cache_timeout=self.response_cache_timeout,
+            headers=headers,
+            timeout=30,
+        )
         if self.inquest_analysis == "dfi_search" and self.observable_classification == Classification.HASH:
             result["hash_type"] = self.hash_type
 
         if self.generic_identifier_mode == "auto":
-            result["type_of_generic"] = self.type_of_generic()
+            result["type_of_generic"] = inferred_type
 
         result["link"] = f"https://labs.inquest.net/{link}"
         return result
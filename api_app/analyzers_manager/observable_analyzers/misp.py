@@ -2,8 +2,12 @@
 # See the file 'LICENSE' for copying permission.
 
 import datetime
+import logging
+import threading
+import time
 
 import pymisp
+import requests
 from django.conf import settings
 
 from api_app.analyzers_manager import classes
@@ -13,6 +17,13 @@ from api_app.analyzers_manager.exceptions import (
 )
 from api_app.choices import Classification
 
+logger = logging.getLogger(__name__)
+
+MISP_CLIENT_TTL = 60 * 60
+# (url, key, ssl, debug, timeout) -> (client, expires_at)
+_MISP_CLIENTS: dict[tuple, tuple[pymisp.PyMISP, float]] = {}
+_MISP_CLIENTS_LOCK = threading.Lock()
+
 
 class MISP(classes.ObservableAnalyzer):
     _api_key_name: str
@@ -33,20 +44,52 @@ class MISP(classes.ObservableAnalyzer):
     def update(self):
         pass
 
-    def run(self):
+    @property
+    def _misp_client_key(self) -> tuple:
         # this allows self-signed certificates to be used
         ssl_param = (
             f"{settings.PROJECT_LOCATION}/configuration/misp_ssl.crt"
             if self.ssl_check and self.self_signed_certificate
             else self.ssl_check
         )
-        misp_instance = pymisp.PyMISP(
-            url=self._url_key_name,
-            key=self._api_key_name,
-            ssl=ssl_param,
-            debug=self.debug,
-            timeout=self.timeout,
-        )
+        return self._url_key_name, self._api_key_name, ssl_param, self.debug, self.timeout
+
+    def _get_misp_instance(self) -> pymisp.PyMISP:
+        """
+        PyMISP contacts the server when instantiated:
+        clients are reused across runs with the same configuration
+        and refreshed every MISP_CLIENT_TTL seconds.
+        """
+        key = self._misp_client_key
+        with _MISP_CLIENTS_LOCK:
+            cached = _MISP_CLIENTS.get(key)
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+            url, api_key, ssl_param, debug, timeout = key
+            misp_instance = pymisp.PyMISP(
+                url=url,
+                key=api_key,
+                ssl=ssl_param,
+                debug=debug,
+                timeout=timeout,
+            )
+            _MISP_CLIENTS[key] = (misp_instance, time.monotonic() + MISP_CLIENT_TTL)
+            return misp_instance
+
+    def _evict_misp_instance(self) -> None:
+        with _MISP_CLIENTS_LOCK:
+            _MISP_CLIENTS.pop(self._misp_client_key, None)
+
+    def _search(self, **params):
+        try:
+            return self._get_misp_instance().search(**params)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # the cached client may be stale (e.g. server restarted): retry once with a new one
+            logger.warning(f"MISP search on {self._url_key_name} failed, reconnecting: {e}")
+            self._evict_misp_instance()
+            return self._get_misp_instance().search(**params)
+
+    def run(self):
         now = datetime.datetime.now()
         date_from = now - datetime.timedelta(days=self.from_days)
         params = {
@@ -97,7 +140,7 @@ class MISP(classes.ObservableAnalyzer):
                     "Currently supported are: ip, domain, hash, url, generic."
                 )
 
-        result_search = misp_instance.search(**params)
+        result_search = self._search(**params)
         if isinstance(result_search, dict):
             errors = result_search.get("errors", [])
             if errors:
@@ -34,15 +34,17 @@ class PhishingExtractor(ObservableAnalyzer, DockerBasedAnalyzer):
         # protocol. selenium opens only URL types
         if self.observable_classification == Classification.DOMAIN:
             target = "http://" + target
-        self.args.append(f"--target={target}")
-        if self.proxy_address:
-            self.args.append(f"--proxy_address={self.proxy_address}")
-        if self.window_width:
-            self.args.append(f"--window_width={self.window_width}")
-        if self.window_height:
-            self.args.append(f"--window_height={self.window_height}")
-        if self.user_agent:
-            self.args.append(f"--user_agent={self.user_agent}")
+        self.args.extend(
+            f"--{name}={value}"
+            for name, value in (
+                ("target", target),
+                ("proxy_address", self.proxy_address),
+                ("window_width", self.window_width),
+                ("window_height", self.window_height),
+                ("user_agent", self.user_agent),
+            )
+            if value
+        )
 
     def run(self):
         req_data: {} = {
@@ -1,14 +1,12 @@
 # This file is a part of IntelOwl https://github.com/intelowlproject/IntelOwl
 # See the file 'LICENSE' for copying permission.
 
-import re
-
 import requests
 
 from api_app.analyzers_manager import classes
 from api_app.analyzers_manager.exceptions import AnalyzerRunException
 from api_app.choices import Classification
-from intel_owl.consts import REGEX_CVE, REGEX_EMAIL
+from intel_owl.consts import CVE_RE, EMAIL_RE
 
 
 class Spyse(classes.ObservableAnalyzer):
@@ -27,10 +25,10 @@ class Spyse(classes.ObservableAnalyzer):
             endpoint = "ip"
         elif self.observable_classification == Classification.GENERIC:
             # it may be email
-            if re.match(REGEX_EMAIL, self.observable_name):
+            if EMAIL_RE.match(self.observable_name):
                 endpoint = "email"
             # it may be cve
-            elif re.match(REGEX_CVE, self.observable_name):
+            elif CVE_RE.match(self.observable_name):
                 endpoint = "cve"
             else:
                 raise AnalyzerRunException(
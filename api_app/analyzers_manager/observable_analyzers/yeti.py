@@ -4,6 +4,10 @@
 import requests
 
 from api_app.analyzers_manager import classes
+from api_app.helpers import cached_http_request
+
+# shared across analyses to reuse connections to the YETI instance
+_SESSION = requests.Session()
 
 
 class YETI(classes.ObservableAnalyzer):
@@ -12,6 +16,8 @@ class YETI(classes.ObservableAnalyzer):
     regex: False
     _url_key_name: str
     _api_key_name: str
+    # seconds YETI responses are cached for: opt-in, 0 disables the cache
+    response_cache_timeout: int = 0
 
     def run(self):
         # request payload
@@ -25,12 +31,12 @@ class YETI(classes.ObservableAnalyzer):
         url = f"{self._url_key_name}/api/v2/observablesearch/"
 
         # search for observables
-        resp = requests.post(
-            url=url,
+        return cached_http_request(
+            _SESSION,
+            "POST",
+            url,
+            cache_timeout=self.response_cache_timeout,
             headers=headers,
             json=payload,
             verify=self.verify_ssl,
         )
-        resp.raise_for_status()
-
-        return resp.json()
@@ -5,11 +5,14 @@
 
 import hashlib
 import ipaddress
+import json
 import logging
 import random
 import re
 import warnings
 
+import requests
+from django.core.cache import cache
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -84,3 +87,35 @@ def deprecated(message: str):
         return wrapper
 
     return decorator
+
+
+def cached_http_request(
+    session: requests.Session,
+    method: str,
+    url: str,
+    cache_timeout: int = 300,
+    **kwargs,
+):
+    """
+    Perform an HTTP request and cache its decoded JSON response
+    for `cache_timeout` seconds, to avoid querying a remote service
+    again for the same observable.
+    The cache key is a digest of the method, url, query params, body and headers,
+    so responses fetched with different credentials are never shared.
+    Only successful responses are cached. A `cache_timeout` of 0 disables the cache.
+    """
+
+    def perform_request():
+        response = getattr(session, method.lower())(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    if not cache_timeout:
+        return perform_request()
+    key_material = json.dumps(
+        [method.upper(), url, kwargs.get("params"), kwargs.get("json"), kwargs.get("headers")],
+        sort_keys=True,
+        default=str,
+    )
+    cache_key = f"http_response_{hashlib.sha256(key_material.encode()).hexdigest()}"
+    return cache.get_or_set(cache_key, perform_request, timeout=cache_timeout)
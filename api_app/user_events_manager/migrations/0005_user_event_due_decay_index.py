@@ -0,0 +1,49 @@
+# Generated by Django 4.2.27 on 2026-10-16 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # indexes are built concurrently, so that writes to the event tables are not blocked
+    atomic = False
+
+    dependencies = [
+        ("user_events_manager", "0004_user_event_reason"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="useranalyzableevent",
+            index=models.Index(
+                condition=models.Q(
+                    ("next_decay__isnull", False),
+                    models.Q(("decay_progression", 2), _negated=True),
+                ),
+                fields=["next_decay"],
+                name="analyzable_event_due_decay",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="userdomainwildcardevent",
+            index=models.Index(
+                condition=models.Q(
+                    ("next_decay__isnull", False),
+                    models.Q(("decay_progression", 2), _negated=True),
+                ),
+                fields=["next_decay"],
+                name="domain_wildcard_due_decay",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="useripwildcardevent",
+            index=models.Index(
+                condition=models.Q(
+                    ("next_decay__isnull", False),
+                    models.Q(("decay_progression", 2), _negated=True),
+                ),
+                fields=["next_decay"],
+                name="ip_wildcard_due_decay",
+            ),
+        ),
+    ]
@@ -3,7 +3,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import ForeignKey, GenericIPAddressField
+from django.db.models import ForeignKey, GenericIPAddressField, Q
 from django.db.models.functions import Cast
 from django.utils.timezone import now
 
@@ -19,6 +19,17 @@ from api_app.user_events_manager.queryset import (
 )
 
 
+def due_decay_index(name: str) -> models.Index:
+    # partial index matching the candidates scanned by UserEventQuerySet.decay.
+    # the plain next_decay index is still needed by the API and admin date filters,
+    # which span every decay progression
+    return models.Index(
+        fields=["next_decay"],
+        name=name,
+        condition=Q(next_decay__isnull=False) & ~Q(decay_progression=DecayProgressionEnum.FIXED.value),
+    )
+
+
 class UserEvent(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -75,7 +86,10 @@ class UserAnalyzableEvent(UserEvent):
 
     class Meta:
         unique_together = (("user", "analyzable"),)
-        indexes = [models.Index(fields=["data_model_content_type", "data_model_object_id"])]
+        indexes = [
+            models.Index(fields=["data_model_content_type", "data_model_object_id"]),
+            due_decay_index("analyzable_event_due_decay"),
+        ]
 
     def clean(self):
         super().clean()
@@ -114,6 +128,7 @@ class UserDomainWildCardEvent(UserEvent):
 
     class Meta:
         unique_together = (("user", "query"),)
+        indexes = [due_decay_index("domain_wildcard_due_decay")]
 
     def find_new_analyzables_from_query(self) -> AnalyzableQuerySet:
         return Analyzable.objects.filter(
@@ -147,6 +162,7 @@ class UserIPWildCardEvent(UserEvent):
 
     class Meta:
         unique_together = (("user", "start_ip", "end_ip"),)
+        indexes = [due_decay_index("ip_wildcard_due_decay")]
 
     def find_new_analyzables_from_query(self) -> AnalyzableQuerySet:
         return (
@@ -1,6 +1,10 @@
 import datetime
+from collections import defaultdict
 
-from django.db.models import F, Q, QuerySet, Value
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import DurationField, ExpressionWrapper, F, Q, QuerySet, Value
 from django.db.models.lookups import IRegex, Range
 from django.utils.timezone import now
 
@@ -10,6 +14,101 @@ from api_app.user_events_manager.choices import DecayProgressionEnum
 
 
 class UserEventQuerySet(QuerySet):
+    DECAY_BATCH_SIZE = 1000
+
+    def _data_model_columns(self) -> list[str]:
+        # columns referencing the data model: a generic relation or a foreign key
+        data_model = self.model._meta.get_field("data_model")
+        if isinstance(data_model, GenericForeignKey):
+            return [data_model.fk_field, data_model.ct_field]
+        return ["data_model"]
+
+    def _decay_fields(self) -> list[str]:
+        # only the columns required to decay an event and reach its data model
+        fields = ["id", "decay_progression", "decay_timedelta_days", "next_decay", "decay_times"]
+        return fields + self._data_model_columns()
+
+    def _linear_decay_filter(self, objects: "UserEventQuerySet") -> Q | None:
+        """
+        Events with linear progression whose data model keeps
+        a positive reliability after the decay:
+        they can be decayed with plain column arithmetic
+        """
+        columns = self._data_model_columns()
+        if len(columns) == 1:
+            reliable = Q(data_model__reliability__gt=1)
+        else:
+            fk_field, ct_field = columns
+            queries = [
+                Q(
+                    **{
+                        ct_field: content_type_id,
+                        f"{fk_field}__in": ContentType.objects.get_for_id(content_type_id)
+                        .model_class()
+                        .objects.filter(reliability__gt=1)
+                        .values("pk"),
+                    }
+                )
+                for content_type_id in objects.values_list(ct_field, flat=True).distinct()
+            ]
+            if not queries:
+                return None
+            reliable = Q()
+            for query in queries:
+                reliable |= query
+        return Q(decay_progression=DecayProgressionEnum.LINEAR.value) & reliable
+
+    def _decay_linear(self, objects: "UserEventQuerySet") -> int:
+        columns = self._data_model_columns()
+        data_model_field = self.model._meta.get_field("data_model")
+        # snapshot the matching rows before the first flush: the updates change
+        # the rows matched by the filter. only ids are kept, so this stays small
+        rows = list(objects.values_list("pk", *columns))
+        decayed = 0
+        event_ids = []
+        data_model_ids_by_class = defaultdict(list)
+        for row in rows:
+            event_ids.append(row[0])
+            data_model_class = (
+                ContentType.objects.get_for_id(row[2]).model_class()
+                if len(columns) == 2
+                else data_model_field.related_model
+            )
+            data_model_ids_by_class[data_model_class].append(row[1])
+            if len(event_ids) >= self.DECAY_BATCH_SIZE:
+                decayed += self._flush_linear_decay(event_ids, data_model_ids_by_class)
+        decayed += self._flush_linear_decay(event_ids, data_model_ids_by_class)
+        return decayed
+
+    def _flush_linear_decay(self, event_ids: list, data_model_ids_by_class: dict) -> int:
+        for data_model_class, data_model_ids in data_model_ids_by_class.items():
+            data_model_class.objects.filter(pk__in=data_model_ids).update(reliability=F("reliability") - 1)
+        self.model.objects.filter(pk__in=event_ids).update(
+            decay_times=F("decay_times") + 1,
+            next_decay=F("next_decay")
+            + ExpressionWrapper(
+                F("decay_timedelta_days") * datetime.timedelta(days=1),
+                output_field=DurationField(),
+            ),
+        )
+        decayed = len(event_ids)
+        event_ids.clear()
+        data_model_ids_by_class.clear()
+        return decayed
+
+    def _flush_decay(self, events: list, data_models_by_class: dict) -> int:
+        for data_model_class, data_models in data_models_by_class.items():
+            data_model_class.objects.bulk_update(
+                data_models, ["reliability"], batch_size=self.DECAY_BATCH_SIZE
+            )
+        self.model.objects.bulk_update(
+            events, ["decay_times", "next_decay"], batch_size=self.DECAY_BATCH_SIZE
+        )
+        decayed = len(events)
+        events.clear()
+        data_models_by_class.clear()
+        return decayed
+
     def decay(self):
         from api_app.user_events_manager.models import UserEvent
 
@@ -20,23 +119,41 @@ class UserEventQuerySet(QuerySet):
                 next_decay__lte=now(),
             )
         )
-        # TODO we can probably translate all of this in sql query
-        for obj in objects:
-            obj: UserEvent
-            obj.decay_times += 1
-            obj.data_model.reliability -= 1
-            if obj.data_model.reliability == 0:
-                obj.next_decay = None
-            else:
-                if obj.decay_progression == DecayProgressionEnum.LINEAR.value:
-                    obj.next_decay += datetime.timedelta(days=obj.decay_timedelta_days)
-                elif obj.decay_progression == DecayProgressionEnum.INVERSE_EXPONENTIAL.value:
-                    obj.next_decay += datetime.timedelta(
-                        days=obj.decay_timedelta_days ** (obj.decay_times + 1)
-                    )
-            obj.data_model.save()
-            obj.save()
-        return objects.count()
+        decayed = 0
+        events = []
+        data_models_by_class = defaultdict(list)
+        with transaction.atomic():
+            linear_filter = self._linear_decay_filter(objects)
+            # the common linear case is handled in SQL, after the rest
+            # so that the same event is never decayed twice
+            python_objects = objects.exclude(linear_filter) if linear_filter else objects
+            # events are streamed and written back in batches (one UPDATE per table),
+            # so that memory stays bounded even with a large backlog
+            for obj in (
+                python_objects.only(*self._decay_fields())
+                .prefetch_related("data_model")
+                .iterator(chunk_size=self.DECAY_BATCH_SIZE)
+            ):
+                obj: UserEvent
+                obj.decay_times += 1
+                obj.data_model.reliability -= 1
+                if obj.data_model.reliability == 0:
+                    obj.next_decay = None
+                else:
+                    if obj.decay_progression == DecayProgressionEnum.LINEAR.value:
+                        obj.next_decay += datetime.timedelta(days=obj.decay_timedelta_days)
+                    elif obj.decay_progression == DecayProgressionEnum.INVERSE_EXPONENTIAL.value:
+                        obj.next_decay += datetime.timedelta(
+                            days=obj.decay_timedelta_days ** (obj.decay_times + 1)
+                        )
+                events.append(obj)
+                data_models_by_class[obj.data_model.__class__].append(obj.data_model)
+                if len(events) >= self.DECAY_BATCH_SIZE:
+                    decayed += self._flush_decay(events, data_models_by_class)
+            decayed += self._flush_decay(events, data_models_by_class)
+            if linear_filter:
+                decayed += self._decay_linear(objects.filter(linear_filter))
+        return decayed
 
     def visible_for_user(self, user):
         if user.has_membership():
@@ -46,14 +163,26 @@ class UserEventQuerySet(QuerySet):
 
         return self.filter(user_query)
 
+    @staticmethod
+    def _compute_initial_next_decay(obj) -> None:
+        if obj.data_model.reliability != 0:
+            obj.next_decay = obj.date + datetime.timedelta(days=obj.decay_timedelta_days)
+
     def create(self, **kwargs):
         obj = self.model(**kwargs)
         self._for_write = True
-        if obj.data_model.reliability != 0:
-            obj.next_decay = obj.date + datetime.timedelta(days=obj.decay_timedelta_days)
+        self._compute_initial_next_decay(obj)
         obj.save(force_insert=True, using=self.db)
         return obj
 
+    def bulk_create_with_decay(self, objs: list) -> list:
+        """
+        Batched counterpart of create(), for callers creating many events at once
+        """
+        for obj in objs:
+            self._compute_initial_next_decay(obj)
+        return self.bulk_create(objs, batch_size=500)
+
 
 class UserDomainWildCardEventQuerySet(UserEventQuerySet):
     def matches(self, analyzable: Analyzable) -> "UserDomainWildCardEventQuerySet":
@@ -61,7 +190,9 @@ class UserDomainWildCardEventQuerySet(UserEventQuerySet):
             Classification.DOMAIN.value,
             Classification.URL.value,
         ]:
-            return self.annotate(matches=IRegex(Value(analyzable.name), F("query"))).filter(matches=True)
+            # the pattern is the column and the analyzable name is the constant:
+            # no index can serve this lookup, but the result is only filtered on, not selected
+            return self.alias(matches=IRegex(Value(analyzable.name), F("query"))).filter(matches=True)
         return self.none()
 
     def create(self, **kwargs):
@@ -69,11 +200,17 @@ class UserDomainWildCardEventQuerySet(UserEventQuerySet):
         instance.analyzables.add(*instance.find_new_analyzables_from_query())
         return instance
 
+    def bulk_create_with_decay(self, objs: list) -> list:
+        instances = super().bulk_create_with_decay(objs)
+        for instance in instances:
+            instance.analyzables.add(*instance.find_new_analyzables_from_query())
+        return instances
+
 
 class UserIPWildCardEventQuerySet(UserEventQuerySet):
     def matches(self, analyzable: Analyzable) -> "UserIPWildCardEventQuerySet":
         if analyzable.classification == Classification.IP.value:
-            return self.annotate(matches=Range(Value(analyzable.name), (F("start_ip"), F("end_ip")))).filter(
+            return self.alias(matches=Range(Value(analyzable.name), (F("start_ip"), F("end_ip")))).filter(
                 matches=True
             )
         return self.none()
@@ -82,3 +219,9 @@ class UserIPWildCardEventQuerySet(UserEventQuerySet):
         instance = super().create(**kwargs)
         instance.analyzables.add(*instance.find_new_analyzables_from_query())
         return instance
+
+    def bulk_create_with_decay(self, objs: list) -> list:
+        instances = super().bulk_create_with_decay(objs)
+        for instance in instances:
+            instance.analyzables.add(*instance.find_new_analyzables_from_query())
+        return instances
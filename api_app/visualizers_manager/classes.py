@@ -500,6 +500,10 @@ class VisualizablePage:
     def add_level(self, level: VisualizableLevel):
         self._levels.append(level)
 
+    def add_levels(self, *levels: VisualizableLevel):
+        # None entries are skipped, so optional levels can be passed directly
+        self._levels.extend(filter(None, levels))
+
     def to_dict(self) -> Tuple[str, List[Dict]]:
         return self.name, [level.to_dict() for level in self._levels]
 
@@ -246,26 +246,22 @@ class DomainReputationServices(Visualizer):
         second_level_elements.append(self._otxquery())
 
         page = self.Page(name="Reputation")
-        page.add_level(
+        page.add_levels(
             self.Level(
                 position=1,
                 size=self.LevelSize.S_3,
                 horizontal_list=self.HList(value=first_level_elements),
-            )
-        )
-        page.add_level(
+            ),
             self.Level(
                 position=2,
                 size=self.LevelSize.S_5,
                 horizontal_list=self.HList(value=second_level_elements),
-            )
-        )
-        page.add_level(
+            ),
             self.Level(
                 position=3,
                 size=self.LevelSize.S_6,
                 horizontal_list=self.HList(value=third_level_elements),
-            )
+            ),
         )
         logger.debug(f"levels: {page.to_dict()}")
         return [page.to_dict()]
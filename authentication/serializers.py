@@ -7,7 +7,6 @@ registration, email verification, login, and token generation.
 """
 
 import logging
-import re
 
 import rest_email_auth.serializers
 from django.conf import settings
@@ -26,7 +25,7 @@ from certego_saas.apps.user.serializers import UserSerializer
 from certego_saas.ext.upload import Slack
 from certego_saas.models import User
 from certego_saas.settings import certego_apps_settings
-from intel_owl.consts import REGEX_PASSWORD
+from intel_owl.consts import PASSWORD_RE
 
 from .models import UserProfile
 
@@ -208,7 +207,7 @@ class RegistrationSerializer(rest_email_auth.serializers.RegistrationSerializer)
         """
         super().validate_password(password)
 
-        if re.match(REGEX_PASSWORD, password):
+        if PASSWORD_RE.match(password):
             return password
         else:
             raise ValidationError("Invalid password")
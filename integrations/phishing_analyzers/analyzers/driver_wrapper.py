@@ -1,11 +1,16 @@
 import functools
 import logging
 import os
+import time
 from random import randint
 from typing import Iterator
 
 from selenium.common import WebDriverException
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    TimeoutException,
+)
 from selenium.webdriver.chromium.options import ChromiumOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -35,21 +40,44 @@ logger.addHandler(fh_err)
 logger.setLevel(log_level)
 
 
+MAX_ATTEMPTS = 3
+# seconds waited before the second attempt, doubled on every following one
+BACKOFF_BASE = 1
+# errors meaning that the remote session is gone: only a new session recovers from them
+SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException)
+
+
 def driver_exception_handler(func):
     @functools.wraps(func)
     def handle_exception(self, *args, **kwargs):
         # if url is set the action should be "navigate"
         url = kwargs.get("url", "")
-        try:
-            return func(self, *args, **kwargs)
-        except WebDriverException as e:
-            logger.exception(
-                f"Error while performing {func.__name__}"
-                f"{' for url=' + url if func.__name__ == 'navigate' else ''}: {e}"
-            )
-            # default is 5
-            self.restart(motivation=func.__name__, timeout_wait_page=5)
-            func(self, *args, **kwargs)
+        needs_restart = False
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                # restarting inside the try lets a failed restart use up
+                # an attempt instead of aborting the remaining ones
+                if needs_restart:
+                    # a retried navigate loads the page by itself
+                    self.restart(
+                        motivation=func.__name__,
+                        # default is 5
+                        timeout_wait_page=5,
+                        renavigate=func.__name__ != "navigate",
+                    )
+                return func(self, *args, **kwargs)
+            except WebDriverException as e:
+                logger.exception(
+                    f"Error while performing {func.__name__}"
+                    f"{' for url=' + url if func.__name__ == 'navigate' else ''}"
+                    f" (attempt {attempt}/{MAX_ATTEMPTS}): {e}"
+                )
+                # a timeout leaves the session usable and is retried on it,
+                # a lost session is replaced, anything else is raised
+                if attempt == MAX_ATTEMPTS or not isinstance(e, (TimeoutException, *SESSION_ERRORS)):
+                    raise
+                needs_restart = isinstance(e, SESSION_ERRORS)
+                time.sleep(BACKOFF_BASE * 2 ** (attempt - 1))
 
     return handle_exception
 
@@ -119,22 +147,30 @@ class DriverWrapper:
 
         return self._pick_free_port_from_pool(sw_options, options)
 
-    def restart(self, motivation: str = "", timeout_wait_page: int = 0):
+    def restart(self, motivation: str = "", timeout_wait_page: int = 0, renavigate: bool = True):
         logger.info(f"{self._driver.session_id}: Restarting driver: {motivation=}")
-        self._driver.quit()
+        try:
+            self._driver.quit()
+        except WebDriverException as e:
+            # the session may already be dead: a new one is created anyway
+            logger.warning(f"{self._driver.session_id}: Failed to quit driver: {e}")
         self._driver = self._init_driver(
             window_width=self.window_width,
             window_height=self.window_height,
             user_agent=self.user_agent,
         )
-        if self.last_url:
+        if renavigate and self.last_url:
             logger.info(
                 f"{self._driver.session_id}: Navigating to {self.last_url} after driver has restarted"
             )
-            self.navigate(self.last_url, timeout_wait_page=timeout_wait_page)
+            # undecorated navigation: retries are driven by the caller's handler
+            self._navigate(self.last_url, timeout_wait_page=timeout_wait_page)
 
     @driver_exception_handler
     def navigate(self, url: str = "", timeout_wait_page: int = 0):
+        self._navigate(url, timeout_wait_page=timeout_wait_page)
+
+    def _navigate(self, url: str = "", timeout_wait_page: int = 0):
         if not url:
             logger.error("Empty URL! Something's wrong!")
             return
@@ -4,8 +4,14 @@
 # This file is a part of IntelOwl https://github.com/intelowlproject/IntelOwl
 # See the file 'LICENSE' for copying permission.
 
+import re
+
 REGEX_EMAIL = r"^[\w\.\+\-]+\@[\w]+\.[a-z]{2,3}$"
 REGEX_CVE = r"CVE-\d{4}-\d{4,7}"
 REGEX_PASSWORD = r"^[a-zA-Z0-9]{12,}$"
+# compiled once at import so that callers skip the re module cache lookup
+EMAIL_RE = re.compile(REGEX_EMAIL)
+CVE_RE = re.compile(REGEX_CVE)
+PASSWORD_RE = re.compile(REGEX_PASSWORD)
 
 DEFAULT_SOFT_TIME_LIMIT = 300
@@ -1,6 +1,9 @@
-import subprocess
+import os
+import tempfile
+from io import BytesIO
 from unittest.mock import MagicMock, patch
 
+from api_app.analyzers_manager.file_analyzers import capa_info
 from api_app.analyzers_manager.file_analyzers.capa_info import CapaInfo
 
 from .base_test_class import BaseFileAnalyzerTest
@@ -9,31 +12,43 @@ from .base_test_class import BaseFileAnalyzerTest
 class TestCapaInfoAnalyzer(BaseFileAnalyzerTest):
     analyzer_class = CapaInfo
 
+    def setUp(self):
+        super().setUp()
+        # the latest version lookup writes a stamp file and caches at module level:
+        # keep both out of the developer's MEDIA_ROOT and out of other tests
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.version_stamp_patcher = patch.object(
+            capa_info,
+            "VERSION_STAMP_FILE",
+            os.path.join(self.tmp_dir.name, "capa_rules.version"),
+        )
+        self.version_stamp_patcher.start()
+        capa_info._LATEST_VERSION_CACHE.clear()
+
+    def tearDown(self):
+        capa_info._LATEST_VERSION_CACHE.clear()
+        self.version_stamp_patcher.stop()
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
     def get_mocked_response(self):
-        response_from_command = subprocess.CompletedProcess(
-            args=[
-                "capa",
-                "--quiet",
-                "--json",
-                "-r",
-                "/opt/deploy/files_required/capa/capa-rules",
-                "-s",
-                "/opt/deploy/files_required/capa/sigs",
-                "/opt/deploy/files_required/06ebf06587b38784e2af42dd5fbe56e5",
-            ],
-            returncode=0,
-            stdout='{"meta": {}, "rules": {"contain obfuscated stackstrings": {}, "enumerate PE sections":{}}}',
-            stderr="",
+        mock_process = MagicMock()
+        mock_process.__enter__.return_value = mock_process
+        mock_process.stdout = BytesIO(
+            b'{"meta": {}, "rules": {"contain obfuscated stackstrings": {}, "enumerate PE sections":{}}}'
         )
+        mock_process.wait.return_value = 0
 
         mock_requests_get = MagicMock()
+        mock_requests_get.status_code = 200
+        mock_requests_get.headers = {}
         mock_requests_get.json.return_value = {"tag_name": "v1.0.0"}
 
         return [
             patch.object(CapaInfo, "update", return_value=True),
-            patch("subprocess.run", return_value=response_from_command),
+            patch("subprocess.Popen", return_value=mock_process),
             patch(
-                "api_app.analyzers_manager.file_analyzers.capa_info.requests.get",
+                "api_app.analyzers_manager.file_analyzers.capa_info._SESSION.get",
                 return_value=mock_requests_get,
             ),
             patch.object(CapaInfo, "_check_if_latest_version", return_value=True),
@@ -13,7 +13,10 @@ class InQuestTestCase(BaseAnalyzerTest):
     @staticmethod
     def get_mocked_response():
         mock_response = {"result": "ok", "data": ["some IOC result"]}
-        return patch("requests.get", return_value=MockUpResponse(mock_response, 200))
+        return patch(
+            "api_app.analyzers_manager.observable_analyzers.inquest._SESSION.get",
+            return_value=MockUpResponse(mock_response, 200),
+        )
 
     @classmethod
     def get_extra_config(cls) -> dict:
@@ -1,6 +1,10 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from api_app.analyzers_manager.observable_analyzers.misp import MISP
+import pymisp
+import requests
+
+from api_app.analyzers_manager.models import AnalyzerConfig
+from api_app.analyzers_manager.observable_analyzers.misp import _MISP_CLIENTS, MISP
 from tests.api_app.analyzers_manager.unit_tests.observable_analyzers.base_test_class import (
     BaseAnalyzerTest,
 )
@@ -10,6 +14,15 @@ from tests.mock_utils import MockResponseNoOp
 class MISPTestCase(BaseAnalyzerTest):
     analyzer_class = MISP
 
+    def setUp(self):
+        super().setUp()
+        # clients are cached at module level: do not leak mocks between tests
+        _MISP_CLIENTS.clear()
+
+    def tearDown(self):
+        _MISP_CLIENTS.clear()
+        super().tearDown()
+
     @staticmethod
     def get_mocked_response():
         return patch("pymisp.PyMISP", return_value=MockResponseNoOp({"response": "mocked"}, 200))
@@ -30,3 +43,35 @@ class MISPTestCase(BaseAnalyzerTest):
             "published": True,
             "metadata": False,
         }
+
+    def _get_analyzer(self) -> MISP:
+        config = AnalyzerConfig.objects.filter(python_module=self.analyzer_class.python_module).first()
+        if config is None:
+            self.skipTest(f"No AnalyzerConfig found for {self.analyzer_class.python_module}")
+        return self._setup_analyzer(config, "ip", self.get_sample_observable("ip"))
+
+    def test_client_reused_across_runs(self):
+        with self.get_mocked_response() as mock_misp:
+            self._get_analyzer().run()
+            self._get_analyzer().run()
+        mock_misp.assert_called_once()
+
+    def test_reconnect_once_on_connection_error(self):
+        stale_client, fresh_client = MagicMock(), MagicMock()
+        stale_client.search.side_effect = requests.exceptions.ConnectionError("connection reset")
+        fresh_client.search.return_value = {}
+        with patch("pymisp.PyMISP", side_effect=[stale_client, fresh_client]) as mock_misp:
+            result = self._get_analyzer().run()
+        self.assertEqual(mock_misp.call_count, 2)
+        stale_client.search.assert_called_once()
+        fresh_client.search.assert_called_once()
+        self.assertEqual(result["result_search"], {})
+
+    def test_no_reconnect_on_misp_error(self):
+        client = MagicMock()
+        client.search.side_effect = pymisp.PyMISPError("bad request")
+        with patch("pymisp.PyMISP", return_value=client) as mock_misp:
+            with self.assertRaises(pymisp.PyMISPError):
+                self._get_analyzer().run()
+        mock_misp.assert_called_once()
+        client.search.assert_called_once()
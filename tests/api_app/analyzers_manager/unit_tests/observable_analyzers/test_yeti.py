@@ -20,7 +20,10 @@ class YETITestCase(BaseAnalyzerTest):
                 "source": "malwaredb",
             }
         ]
-        return patch("requests.post", return_value=MockUpResponse(mock_response, 200))
+        return patch(
+            "api_app.analyzers_manager.observable_analyzers.yeti._SESSION.post",
+            return_value=MockUpResponse(mock_response, 200),
+        )
 
     @classmethod
     def get_extra_config(cls) -> dict:
@@ -1,9 +1,14 @@
 # This file is a part of IntelOwl https://github.com/intelowlproject/IntelOwl
 # See the file 'LICENSE' for copying permission.
 
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
 from django.test import TestCase
 
 from api_app.choices import Classification
+from api_app.helpers import cached_http_request
+from tests.mock_utils import MockUpResponse
 
 
 class HelperTests(TestCase):
@@ -40,3 +45,28 @@ class HelperTests(TestCase):
         observable = "iammeia"
         result = Classification.calculate_observable(observable)
         self.assertEqual(result, Classification.GENERIC)
+
+    def test_cached_http_request(self):
+        session = MagicMock()
+        session.get.return_value = MockUpResponse({"result": "ok"}, 200)
+        url = "https://test.intelowl.com/api"
+        cache.clear()
+
+        first = cached_http_request(session, "GET", url, headers={"Authorization": "first"})
+        second = cached_http_request(session, "GET", url, headers={"Authorization": "first"})
+        self.assertEqual(first, {"result": "ok"})
+        self.assertEqual(first, second)
+        session.get.assert_called_once()
+
+        # different credentials must not share a cache entry
+        cached_http_request(session, "GET", url, headers={"Authorization": "second"})
+        self.assertEqual(session.get.call_count, 2)
+        cached_http_request(session, "GET", url)
+        self.assertEqual(session.get.call_count, 3)
+
+        cached_http_request(session, "GET", url, params={"q": "other"})
+        self.assertEqual(session.get.call_count, 4)
+
+        cached_http_request(session, "GET", url, cache_timeout=0)
+        self.assertEqual(session.get.call_count, 5)
+        cache.clear()
@@ -4,6 +4,7 @@ from django.utils.timezone import now
 
 from api_app.analyzables_manager.models import Analyzable
 from api_app.choices import Classification
+from api_app.data_model_manager.models import IPDataModel
 from api_app.user_events_manager.models import (
     UserDomainWildCardEvent,
     UserIPWildCardEvent,
@@ -45,6 +46,38 @@ class TestUserAnalyzableEventQuerySet(CustomTestCase):
 
 
 class TestUserDomainWildCardEventQuerySet(CustomTestCase):
+    def test_decay(self):
+        events = []
+        for query, reliability in ((".*\.first.com", 8), (".*\.second.com", 1)):
+            ue = UserDomainWildCardEventSerializer(
+                data={
+                    "query": query,
+                    "decay_progression": 0,
+                    "decay_timedelta_days": 2,
+                    "data_model_content": {"evaluation": "malicious", "reliability": reliability},
+                },
+                context={"request": MockUpRequest(self.user)},
+            )
+            ue.is_valid()
+            ua = ue.save()
+            ua.next_decay = now() - datetime.timedelta(days=1)
+            ua.save()
+            events.append(ua)
+        number = UserDomainWildCardEvent.objects.filter(pk__in=[ua.pk for ua in events]).decay()
+        self.assertEqual(number, 2)
+        linear, to_zero = events
+        linear.refresh_from_db()
+        linear.data_model.refresh_from_db()
+        self.assertEqual(linear.data_model.reliability, 7)
+        self.assertEqual(linear.decay_times, 1)
+        self.assertGreater(linear.next_decay, now())
+        to_zero.refresh_from_db()
+        to_zero.data_model.refresh_from_db()
+        self.assertEqual(to_zero.data_model.reliability, 0)
+        self.assertIsNone(to_zero.next_decay)
+        for ua in events:
+            ua.delete()
+
     def test_matches(self):
         an = Analyzable.objects.create(
             name="a.test.com",
@@ -70,6 +103,37 @@ class TestUserDomainWildCardEventQuerySet(CustomTestCase):
 
 
 class TestUserIPWildCardEventQuerySet(CustomTestCase):
+    def test_bulk_create_with_decay(self):
+        an = Analyzable.objects.create(
+            name="1.2.3.5",
+            classification=Analyzable.CLASSIFICATIONS.IP,
+        )
+        events = UserIPWildCardEvent.objects.bulk_create_with_decay(
+            [
+                UserIPWildCardEvent(
+                    user=self.user,
+                    start_ip=start_ip,
+                    end_ip=end_ip,
+                    data_model=IPDataModel.objects.create(evaluation="malicious", reliability=reliability),
+                    decay_progression=0,
+                    decay_timedelta_days=3,
+                )
+                for start_ip, end_ip, reliability in (
+                    ("1.2.3.0", "1.2.3.255", 8),
+                    ("1.2.4.0", "1.2.4.255", 0),
+                )
+            ]
+        )
+        self.assertEqual(2, UserIPWildCardEvent.objects.filter(pk__in=[ue.pk for ue in events]).count())
+        matching, unreliable = events
+        self.assertEqual(matching.next_decay, matching.date + datetime.timedelta(days=3))
+        self.assertIsNone(unreliable.next_decay)
+        self.assertEqual([an.pk], list(matching.analyzables.values_list("pk", flat=True)))
+        self.assertFalse(unreliable.analyzables.exists())
+        for ue in events:
+            ue.delete()
+        an.delete()
+
     def test_matches(self):
         an = Analyzable.objects.create(
             name="1.2.3.5",
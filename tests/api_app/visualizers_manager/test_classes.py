@@ -458,6 +458,16 @@ class VisualizablePageTestCase(CustomTestCase):
         }
         self.assertEqual(vl.to_dict()[1][0], expected_result)
 
+    def test_add_levels(self):
+        vvl = VisualizableHorizontalList(value=[VisualizableBase(value="test_value")])
+        level1 = VisualizableLevel(position=1, size=VisualizableLevelSize.S_2, horizontal_list=vvl)
+        level2 = VisualizableLevel(position=2, size=VisualizableLevelSize.S_3, horizontal_list=vvl)
+        vl = VisualizablePage(name="test")
+        vl.add_levels(level1, None, level2)
+        name, levels = vl.to_dict()
+        self.assertEqual(name, "test")
+        self.assertEqual(levels, [level1.to_dict(), level2.to_dict()])
+
 
 class VisualizerTestCase(CustomTestCase):
     fixtures = [